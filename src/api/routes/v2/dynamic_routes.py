@@ -6,6 +6,7 @@ engines discovered at startup via entry points.
 
 import asyncio
 import re
+import shutil
 import subprocess
 import time
 from inspect import Parameter, Signature, signature
@@ -81,6 +82,28 @@ def get_safe_suffix(filename: str | None) -> str:
     return suffix
 
 
+def build_tesseract_config(psm: int | None, oem: int | None, dpi: int | None) -> str:
+    """Build the Tesseract CLI config string for PDF rendering.
+
+    Args:
+        psm: Page segmentation mode, or None to use Tesseract's default
+        oem: OCR engine mode, or None to use Tesseract's default
+        dpi: Input resolution, or None to let Tesseract infer it
+
+    Returns:
+        Space-separated Tesseract config flags (empty if all are None)
+    """
+    config_parts: list[str] = []
+    if psm is not None:
+        config_parts.append(f"--psm {psm}")
+    if oem is not None:
+        config_parts.append(f"--oem {oem}")
+    if dpi is not None:
+        config_parts.append(f"--dpi {dpi}")
+
+    return " ".join(config_parts)
+
+
 def get_registry(request: Request) -> EngineRegistry:
     """Dependency to get engine registry from app state."""
     return request.app.state.engine_registry
@@ -188,21 +211,24 @@ def create_process_handler(engine_name: str, param_model: type[BaseModel] | None
         try:
             # Save uploaded file with validated filename
             suffix = get_safe_suffix(file.filename)
-            contents = await file.read()
 
             # Ensure upload directory exists
             upload_dir = Path(settings.upload_dir)
             upload_dir.mkdir(parents=True, exist_ok=True)
 
-            # Create temp file in configured directory (not system /tmp)
+            # Create temp file in configured directory (not system /tmp).
+            # Copy the spooled upload in chunks rather than reading it into memory;
+            # uploads over 1MB are spooled to disk, so copy off the event loop.
             with NamedTemporaryFile(delete=False, suffix=suffix, dir=upload_dir) as tf:
-                tf.write(contents)
+                await file.seek(0)
+                await asyncio.to_thread(shutil.copyfileobj, file.file, tf)
+                file_size = tf.tell()
                 tf.flush()
                 temp_file = tf
             temp_file_name = temp_file.name
 
             # Record file size metric
-            sync_ocr_file_size_bytes.labels(engine=engine_name).observe(len(contents))
+            sync_ocr_file_size_bytes.labels(engine=engine_name).observe(file_size)
 
             # Check circuit breaker before processing
             if not registry.is_engine_available(engine_name):
@@ -224,7 +250,7 @@ def create_process_handler(engine_name: str, param_model: type[BaseModel] | None
             logger.info(
                 "ocr_processing_started",
                 engine=engine_name,
-                file_size=len(contents),
+                file_size=file_size,
                 has_params=validated_params is not None,
             )
 
@@ -336,20 +362,10 @@ def create_process_handler(engine_name: str, param_model: type[BaseModel] | None
                     psm = getattr(validated_params, "psm", None) if validated_params else None
                     oem = getattr(validated_params, "oem", None) if validated_params else None
 
-                    config_parts: list[str] = []
-                    if psm is not None:
-                        config_parts.append(f"--psm {psm}")
-                    if oem is not None:
-                        config_parts.append(f"--oem {oem}")
-                    if dpi is not None:
-                        config_parts.append(f"--dpi {dpi}")
-
-                    config_string = " ".join(config_parts)
-
                     pdf_output = pytesseract.image_to_pdf_or_hocr(
                         str(temp_file_name),
                         lang=lang,
-                        config=config_string,
+                        config=build_tesseract_config(psm, oem, dpi),
                         extension="pdf",
                     )
                     pdf_bytes = (
@@ -5,6 +5,10 @@ import xml.etree.ElementTree as ET
 from pydantic import BaseModel, Field, field_validator
 
 
+class _WellFormednessTarget:
+    """XMLParser target with no callbacks, so parsing builds no elements."""
+
+
 class ErrorResponse(BaseModel):
     """Standard error response model for API errors.
 
@@ -62,8 +66,11 @@ class SyncOCRResponse(BaseModel):
     def validate_hocr_xml(cls, v: str) -> str:
         """Validate that HOCR content is well-formed XML."""
         try:
-            # Basic XML well-formed check
-            ET.fromstring(v)
+            # Well-formedness check only: an empty parser target keeps expat
+            # from building an element tree we would immediately discard.
+            parser = ET.XMLParser(target=_WellFormednessTarget())
+            parser.feed(v)
+            parser.close()
         except ET.ParseError as e:
             raise ValueError(f"HOCR content is not valid XML: {e}") from e
         return v
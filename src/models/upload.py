@@ -27,7 +27,11 @@ class FileFormat(str, Enum):
 
 
 class DocumentUpload(BaseModel):
-    """Model representing an uploaded document."""
+    """Model representing an uploaded document.
+
+    Instances are frozen: upload metadata never changes after the file is
+    saved, and immutability makes them hashable and safe to share.
+    """
 
     file_name: str = Field(..., description="Original filename")
     file_format: FileFormat = Field(..., description="Detected file format")
@@ -37,6 +41,7 @@ class DocumentUpload(BaseModel):
 
     model_config = {
         "arbitrary_types_allowed": True,
+        "frozen": True,
         "json_schema_extra": {
             "example": {
                 "file_name": "document.pdf",
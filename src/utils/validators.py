@@ -2,7 +2,6 @@
 
 from typing import IO
 
-import magic
 import structlog
 from fastapi import HTTPException, UploadFile
 
@@ -27,13 +26,52 @@ class FileTooLargeError(Exception):
 # Supported MIME types
 SUPPORTED_MIME_TYPES = {format.value for format in FileFormat}
 
+# Leading-byte signatures of the supported formats. Matching these directly
+# avoids loading the libmagic database.
+_MAGIC_SIGNATURES: tuple[tuple[bytes, str], ...] = (
+    (b"\xff\xd8\xff", FileFormat.JPEG.value),
+    (b"\x89PNG\r\n\x1a\n", FileFormat.PNG.value),
+    (b"II*\x00", FileFormat.TIFF.value),  # Little-endian TIFF
+    (b"MM\x00*", FileFormat.TIFF.value),  # Big-endian TIFF
+    (b"II+\x00", FileFormat.TIFF.value),  # Little-endian BigTIFF
+    (b"MM\x00+", FileFormat.TIFF.value),  # Big-endian BigTIFF
+)
+
+# A PDF header may follow a UTF-8 BOM and/or leading ASCII whitespace, so it is
+# matched after stripping those rather than as a plain prefix
+_PDF_SIGNATURE = b"%PDF-"
+_UTF8_BOM = b"\xef\xbb\xbf"
+_ASCII_WHITESPACE = b" \t\n\r\f"
+
+# Header bytes read for format detection: the longest signature plus room for a
+# BOM and a few bytes of leading whitespace before a PDF header
+_HEADER_SIZE = 32
+
+# Signatures grouped by their first byte, so detection only compares the candidates
+# that can possibly match instead of scanning every signature
+_SIGNATURES_BY_FIRST_BYTE: dict[bytes, tuple[tuple[bytes, str], ...]] = {
+    first_byte: tuple(entry for entry in _MAGIC_SIGNATURES if entry[0][:1] == first_byte)
+    for first_byte in {signature[:1] for signature, _ in _MAGIC_SIGNATURES}
+}
+
+
+def _detect_mime(file_header: bytes) -> str | None:
+    """Return the MIME type whose signature matches the header, or None."""
+    for signature, mime_type in _SIGNATURES_BY_FIRST_BYTE.get(file_header[:1], ()):
+        if file_header.startswith(signature):
+            return mime_type
+    pdf_header = file_header.removeprefix(_UTF8_BOM).lstrip(_ASCII_WHITESPACE)
+    if pdf_header.startswith(_PDF_SIGNATURE):
+        return FileFormat.PDF.value
+    return None
+
 
 def validate_file_format(file_header: bytes) -> str:
     """
-    Validate file format using python-magic (libmagic).
+    Validate file format by matching the header against known magic bytes.
 
     Args:
-        file_header: File header bytes (at least 2048 bytes recommended)
+        file_header: Leading bytes of the file
 
     Returns:
         MIME type string if format is supported
@@ -41,18 +79,11 @@ def validate_file_format(file_header: bytes) -> str:
     Raises:
         UnsupportedFormatError: If format is not supported
     """
-    try:
-        # Detect MIME type from buffer
-        mime_type = magic.from_buffer(file_header, mime=True)
-    except Exception as e:
-        logger.error("magic_detection_failed", error=str(e))
-        raise UnsupportedFormatError(f"Failed to detect file format: {e}")
-
-    if mime_type not in SUPPORTED_MIME_TYPES:
+    mime_type = _detect_mime(file_header)
+    if mime_type is None:
         raise UnsupportedFormatError(
-            f"Unsupported file format: {mime_type}. Supported: JPEG, PNG, PDF, TIFF"
+            "Unsupported file format: unknown signature. Supported: JPEG, PNG, PDF, TIFF"
         )
-
     return mime_type
 
 
@@ -95,8 +126,8 @@ def validate_upload_file(file: IO[bytes]) -> tuple[str, int]:
     # Validate size early (fail fast before reading content)
     validate_file_size(file_size)
 
-    # Read header for magic detection (2KB is usually sufficient)
-    header = file.read(min(2048, file_size))
+    # Read only the bounded header window, never the whole file
+    header = file.read(_HEADER_SIZE)
     mime_type = validate_file_format(header)
 
     # Single final reset
@@ -117,11 +148,15 @@ async def validate_sync_file_size(file: UploadFile) -> UploadFile:
     Raises:
         HTTPException: 413 Payload Too Large if file exceeds limit
     """
-    # Use the underlying SpooledTemporaryFile to get size without reading content
-    # This avoids loading the entire file into memory for size check.
-    file.file.seek(0, 2)  # Seek to end
-    file_size = file.file.tell()
-    file.file.seek(0)  # Reset to beginning for subsequent processing
+    # Starlette records the byte count while parsing multipart bodies, so the
+    # size is usually known without touching the file.
+    file_size = file.size
+    if file_size is None:
+        # Fall back to the underlying SpooledTemporaryFile: seek/tell gets the
+        # size without loading the entire file into memory.
+        file.file.seek(0, 2)  # Seek to end
+        file_size = file.file.tell()
+        file.file.seek(0)  # Reset to beginning for subsequent processing
 
     sync_max_size = settings.sync_max_file_size_bytes
     if file_size > sync_max_size:
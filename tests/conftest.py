@@ -97,45 +97,47 @@ def mock_tesseract_engine():
 # ==============================================================================
 # File Fixtures
 # ==============================================================================
+# Raw byte fixtures are immutable, so they are built once per session; the 6MB
+# large_file_bytes payload in particular is not worth re-allocating per test.
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_jpeg_bytes():
     """Valid JPEG file bytes with proper magic bytes and JFIF header."""
     return b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x00" + b"\x00" * 100
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_png_bytes():
     """Valid PNG file bytes with proper magic bytes and IHDR chunk."""
     return b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR" + b"\x00" * 100
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pdf_bytes():
     """Valid PDF file bytes with proper magic bytes and header."""
     return b"%PDF-1.4\n%\xc3\xa4\xc3\xbc\xc3\xb6\xc3\x9f\n" + b"\x00" * 100
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tiff_le_bytes():
     """Valid TIFF (little-endian) file bytes."""
     return b"II*\x00" + b"\x00" * 100
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tiff_be_bytes():
     """Valid TIFF (big-endian) file bytes."""
     return b"MM\x00*" + b"\x00" * 100
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_file_bytes():
     """Invalid file format bytes (not a supported format)."""
     return b"INVALID_FORMAT" + b"\x00" * 100
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def large_file_bytes():
     """File exceeding the 5MB sync upload limit (6MB)."""
     # 6MB file (exceeds 5MB sync limit)
@@ -170,9 +172,10 @@ def create_upload_file():
 # ==============================================================================
 # HOCR Fixtures
 # ==============================================================================
+# HOCR samples are immutable strings, so they are shared across the session.
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_hocr():
     """Valid HOCR XML with page, words, and bounding boxes."""
     return """<?xml version="1.0" encoding="UTF-8"?>
@@ -191,7 +194,15 @@ def sample_hocr():
 </html>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def parsed_sample_hocr(sample_hocr):
+    """sample_hocr parsed once per session (HOCRInfo is an immutable NamedTuple)."""
+    from ocrbridge.core.utils.hocr import parse_hocr
+
+    return parse_hocr(sample_hocr)
+
+
+@pytest.fixture(scope="session")
 def sample_hocr_multi_page():
     """Valid HOCR XML with multiple pages."""
     return """<?xml version="1.0" encoding="UTF-8"?>
@@ -209,7 +220,7 @@ def sample_hocr_multi_page():
 </html>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_hocr_no_pages():
     """Invalid HOCR (missing ocr_page elements)."""
     return """<?xml version="1.0" encoding="UTF-8"?>
@@ -220,7 +231,7 @@ def invalid_hocr_no_pages():
 </html>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_hocr_no_bbox():
     """Invalid HOCR (missing bounding boxes)."""
     return """<?xml version="1.0" encoding="UTF-8"?>
@@ -296,10 +307,11 @@ def temp_test_file(tmp_path):
 # ==============================================================================
 # PIL-Generated Test Images (for E2E tests)
 # ==============================================================================
+# Tests only read the generated images, so each is rendered once per session.
 
 
-@pytest.fixture
-def test_image_with_text(tmp_path):
+@pytest.fixture(scope="session")
+def test_image_with_text(tmp_path_factory):
     """Generate a test image with text using PIL for E2E tests.
 
     Returns:
@@ -326,14 +338,14 @@ def test_image_with_text(tmp_path):
     draw.text((20, 50), text, fill="black", font=font)
 
     # Save to temporary file
-    img_path = tmp_path / "test_image.png"
+    img_path = tmp_path_factory.mktemp("images") / "test_image.png"
     img.save(img_path, "PNG")
 
     return img_path
 
 
-@pytest.fixture
-def test_image_simple_text(tmp_path):
+@pytest.fixture(scope="session")
+def test_image_simple_text(tmp_path_factory):
     """Generate simple test image with clear text for OCR.
 
     Returns:
@@ -359,14 +371,14 @@ def test_image_simple_text(tmp_path):
     draw.text((50, 150), text, fill="black", font=font)
 
     # Save as JPEG
-    img_path = tmp_path / "simple_text.jpg"
+    img_path = tmp_path_factory.mktemp("images") / "simple_text.jpg"
     img.save(img_path, "JPEG", quality=95)
 
     return img_path
 
 
-@pytest.fixture
-def test_image_multiline(tmp_path):
+@pytest.fixture(scope="session")
+def test_image_multiline(tmp_path_factory):
     """Generate test image with multiple lines of text.
 
     Returns:
@@ -392,7 +404,7 @@ def test_image_multiline(tmp_path):
         draw.text((30, y_offset), line, fill="black", font=font)
         y_offset += 60
 
-    img_path = tmp_path / "multiline.png"
+    img_path = tmp_path_factory.mktemp("images") / "multiline.png"
     img.save(img_path, "PNG")
 
     return img_path
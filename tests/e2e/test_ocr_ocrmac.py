@@ -10,19 +10,23 @@ Skip with: pytest -m "not ocrmac"
 
 import pytest
 
-# Check if ocrmac is available
-try:
-    from ocrbridge.engines.ocrmac import OcrmacEngine  # type: ignore
+from src.utils.platform import is_macos
 
-    ocrmac_available = True
-except ImportError:
-    ocrmac_available = False
+# Check if ocrmac is available; off macOS, skip without importing the engine
+ocrmac_available = False
+if is_macos():
+    try:
+        from ocrbridge.engines.ocrmac import OcrmacEngine  # type: ignore
+
+        ocrmac_available = True
+    except ImportError:
+        pass
 
 OCRMAC_AVAILABLE = ocrmac_available
 
 pytestmark = [
     pytest.mark.ocrmac,
-    pytest.mark.skipif(not OCRMAC_AVAILABLE, reason="ocrmac engine not installed"),
+    pytest.mark.skipif(not OCRMAC_AVAILABLE, reason="ocrmac requires macOS and the engine package"),
 ]
 
 
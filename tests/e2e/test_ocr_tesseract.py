@@ -4,20 +4,33 @@ These tests use the actual Tesseract engine (not mocks) to validate
 end-to-end OCR functionality. Tests are skipped if Tesseract is not installed.
 """
 
+import shutil
 from pathlib import Path
 
 import pytest
-from ocrbridge.engines.tesseract import TesseractEngine
 
-# Skip all tests if Tesseract is not available
-pytest.importorskip("ocrbridge.engines.tesseract")
+# Check if Tesseract engine package and binary are available
+try:
+    from ocrbridge.engines.tesseract import TesseractEngine
 
-pytestmark = pytest.mark.tesseract
+    tesseract_available = shutil.which("tesseract") is not None
+except ImportError:
+    tesseract_available = False
 
+TESSERACT_AVAILABLE = tesseract_available
 
-@pytest.fixture
+pytestmark = [
+    pytest.mark.tesseract,
+    pytest.mark.skipif(not TESSERACT_AVAILABLE, reason="Tesseract not installed"),
+]
+
+
+@pytest.fixture(scope="module")
 def tesseract_engine():
-    """Create real Tesseract engine instance."""
+    """Create real Tesseract engine instance.
+
+    Scope is module-level to reuse the engine instance across tests.
+    """
     return TesseractEngine()
 
 
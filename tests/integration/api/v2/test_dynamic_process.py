@@ -8,6 +8,8 @@ These tests hit the dynamically generated endpoints:
 
 import io
 
+import pytest
+
 
 def test_tesseract_process_success(client, sample_jpeg_bytes):
     files = {"file": ("test.jpg", io.BytesIO(sample_jpeg_bytes), "image/jpeg")}
@@ -22,7 +24,8 @@ def test_tesseract_process_success(client, sample_jpeg_bytes):
     assert data.get("pages", 0) >= 1
 
 
-def test_tesseract_process_pdf_download_success(client, sample_jpeg_bytes, monkeypatch):
+@pytest.mark.parametrize("engine", ["tesseract", "easyocr", "ocrmac"])
+def test_process_pdf_download_success(client, sample_jpeg_bytes, monkeypatch, engine):
     monkeypatch.setattr(
         "src.api.routes.v2.dynamic_routes.pytesseract.image_to_pdf_or_hocr",
         lambda *args, **kwargs: b"%PDF-1.7\nmock\n",
@@ -31,39 +34,7 @@ def test_tesseract_process_pdf_download_success(client, sample_jpeg_bytes, monke
     files = {"file": ("test.jpg", io.BytesIO(sample_jpeg_bytes), "image/jpeg")}
     data = {"output_format": "pdf"}
 
-    resp = client.post("/v2/ocr/tesseract/process", files=files, data=data)
-    assert resp.status_code == 200
-    assert resp.headers.get("content-type", "").startswith("application/pdf")
-    assert "attachment;" in resp.headers.get("content-disposition", "")
-    assert resp.content.startswith(b"%PDF")
-
-
-def test_easyocr_process_pdf_download_success(client, sample_jpeg_bytes, monkeypatch):
-    monkeypatch.setattr(
-        "src.api.routes.v2.dynamic_routes.pytesseract.image_to_pdf_or_hocr",
-        lambda *args, **kwargs: b"%PDF-1.7\nmock\n",
-    )
-
-    files = {"file": ("test.jpg", io.BytesIO(sample_jpeg_bytes), "image/jpeg")}
-    data = {"output_format": "pdf"}
-
-    resp = client.post("/v2/ocr/easyocr/process", files=files, data=data)
-    assert resp.status_code == 200
-    assert resp.headers.get("content-type", "").startswith("application/pdf")
-    assert "attachment;" in resp.headers.get("content-disposition", "")
-    assert resp.content.startswith(b"%PDF")
-
-
-def test_ocrmac_process_pdf_download_success(client, sample_jpeg_bytes, monkeypatch):
-    monkeypatch.setattr(
-        "src.api.routes.v2.dynamic_routes.pytesseract.image_to_pdf_or_hocr",
-        lambda *args, **kwargs: b"%PDF-1.7\nmock\n",
-    )
-
-    files = {"file": ("test.jpg", io.BytesIO(sample_jpeg_bytes), "image/jpeg")}
-    data = {"output_format": "pdf"}
-
-    resp = client.post("/v2/ocr/ocrmac/process", files=files, data=data)
+    resp = client.post(f"/v2/ocr/{engine}/process", files=files, data=data)
     assert resp.status_code == 200
     assert resp.headers.get("content-type", "").startswith("application/pdf")
     assert "attachment;" in resp.headers.get("content-disposition", "")
@@ -103,6 +74,41 @@ def test_pdf_upload_uses_pdfocr_for_searchable_pdf(client, sample_pdf_bytes, mon
     assert resp.content.startswith(b"%PDF")
 
 
+def test_upload_copied_to_temp_file_with_matching_size(client, sample_jpeg_bytes, monkeypatch):
+    """Test that the temp file holds the uploaded bytes and the recorded size matches."""
+    from tests.mocks.mock_engines import MockTesseractEngine
+
+    # Over Starlette's 1MB spool threshold, so the upload is read back from disk
+    content = sample_jpeg_bytes + b"\x00" * (2 * 1024 * 1024)
+    seen_bytes = []
+    observed_sizes = []
+
+    original_process = MockTesseractEngine.process
+
+    def recording_process(self, file_path, params=None):
+        seen_bytes.append(file_path.read_bytes())
+        return original_process(self, file_path, params)
+
+    class RecordingHistogram:
+        def labels(self, **labels):
+            return self
+
+        def observe(self, value):
+            observed_sizes.append(value)
+
+    monkeypatch.setattr(MockTesseractEngine, "process", recording_process)
+    monkeypatch.setattr(
+        "src.api.routes.v2.dynamic_routes.sync_ocr_file_size_bytes", RecordingHistogram()
+    )
+
+    files = {"file": ("test.jpg", io.BytesIO(content), "image/jpeg")}
+
+    resp = client.post("/v2/ocr/tesseract/process", files=files)
+    assert resp.status_code == 200
+    assert seen_bytes == [content]
+    assert observed_sizes == [len(content)]
+
+
 def test_tesseract_invalid_param_returns_400(client, sample_jpeg_bytes):
     files = {"file": ("test.jpg", io.BytesIO(sample_jpeg_bytes), "image/jpeg")}
     # psm must be <= 13
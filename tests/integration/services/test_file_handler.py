@@ -28,7 +28,6 @@ def file_handler(temp_upload_dir, temp_results_dir, monkeypatch):
     return handler
 
 
-@pytest.mark.asyncio
 async def test_save_upload_creates_file(file_handler, sample_upload_file):
     """Test that save_upload creates file in upload directory."""
     upload = await file_handler.save_upload(sample_upload_file)
@@ -38,7 +37,6 @@ async def test_save_upload_creates_file(file_handler, sample_upload_file):
     assert upload.temp_file_path.parent == file_handler.upload_dir
 
 
-@pytest.mark.asyncio
 async def test_save_upload_preserves_content(file_handler, create_upload_file, sample_jpeg_bytes):
     """Test that uploaded file content is preserved."""
     upload_file = create_upload_file(sample_jpeg_bytes, "test.jpg")
@@ -50,7 +48,6 @@ async def test_save_upload_preserves_content(file_handler, create_upload_file, s
     assert saved_content == sample_jpeg_bytes
 
 
-@pytest.mark.asyncio
 async def test_save_upload_sets_file_permissions(file_handler, sample_upload_file):
     """Test that uploaded files have restrictive permissions (0o600)."""
     upload = await file_handler.save_upload(sample_upload_file)
@@ -64,7 +61,6 @@ async def test_save_upload_sets_file_permissions(file_handler, sample_upload_fil
     assert permissions == 0o600
 
 
-@pytest.mark.asyncio
 async def test_save_upload_unique_filenames(file_handler, create_upload_file, sample_jpeg_bytes):
     """Test that multiple uploads get unique filenames."""
     upload1 = await file_handler.save_upload(create_upload_file(sample_jpeg_bytes, "test.jpg"))
@@ -77,7 +73,6 @@ async def test_save_upload_unique_filenames(file_handler, create_upload_file, sa
     assert upload2.temp_file_path.exists()
 
 
-@pytest.mark.asyncio
 async def test_save_upload_extension_from_mime_type(
     file_handler, create_upload_file, sample_jpeg_bytes, sample_png_bytes, sample_pdf_bytes
 ):
@@ -92,7 +87,6 @@ async def test_save_upload_extension_from_mime_type(
     assert pdf_upload.temp_file_path.suffix == ".pdf"
 
 
-@pytest.mark.asyncio
 async def test_save_upload_validates_format(file_handler, create_upload_file, invalid_file_bytes):
     """Test that save_upload validates file format."""
     from src.utils.validators import UnsupportedFormatError
@@ -103,7 +97,6 @@ async def test_save_upload_validates_format(file_handler, create_upload_file, in
         await file_handler.save_upload(invalid_file)
 
 
-@pytest.mark.asyncio
 async def test_save_upload_validates_size(file_handler, create_upload_file):
     """Test that save_upload validates file size."""
     from src.config import settings
@@ -117,7 +110,6 @@ async def test_save_upload_validates_size(file_handler, create_upload_file):
         await file_handler.save_upload(huge_file)
 
 
-@pytest.mark.asyncio
 async def test_save_upload_returns_document_upload(file_handler, sample_upload_file):
     """Test that save_upload returns DocumentUpload model."""
     from src.models.upload import DocumentUpload
@@ -131,7 +123,18 @@ async def test_save_upload_returns_document_upload(file_handler, sample_upload_f
     assert upload.content_type == "image/jpeg"
 
 
-@pytest.mark.asyncio
+async def test_save_upload_document_upload_is_frozen(file_handler, sample_upload_file):
+    """Test that the returned DocumentUpload is immutable and hashable."""
+    from pydantic import ValidationError
+
+    upload = await file_handler.save_upload(sample_upload_file)
+
+    with pytest.raises(ValidationError):
+        upload.file_size = 1
+
+    assert hash(upload) == hash(upload.model_copy())
+
+
 async def test_delete_temp_file(file_handler, temp_upload_dir):
     """Test deleting temporary file."""
     # Create temp file
@@ -147,7 +150,6 @@ async def test_delete_temp_file(file_handler, temp_upload_dir):
     assert not temp_file.exists()
 
 
-@pytest.mark.asyncio
 async def test_delete_temp_file_nonexistent(file_handler, temp_upload_dir):
     """Test that deleting non-existent file doesn't raise error."""
     nonexistent = temp_upload_dir / "does_not_exist.jpg"
@@ -156,7 +158,6 @@ async def test_delete_temp_file_nonexistent(file_handler, temp_upload_dir):
     await file_handler.delete_temp_file(nonexistent)
 
 
-@pytest.mark.asyncio
 async def test_save_result(file_handler):
     """Test saving HOCR result."""
     job_id = "test_job_123"
@@ -175,7 +176,6 @@ async def test_save_result(file_handler):
     assert result_path.read_text() == hocr_content
 
 
-@pytest.mark.asyncio
 async def test_save_result_sets_permissions(file_handler):
     """Test that result files have restrictive permissions."""
     job_id = "test_job_permissions"
@@ -191,7 +191,6 @@ async def test_save_result_sets_permissions(file_handler):
     assert permissions == 0o600
 
 
-@pytest.mark.asyncio
 async def test_read_result(file_handler):
     """Test reading HOCR result."""
     job_id = "test_job_read"
@@ -206,7 +205,6 @@ async def test_read_result(file_handler):
     assert read_content == original_content
 
 
-@pytest.mark.asyncio
 async def test_save_and_read_large_result(file_handler):
     """Test saving and reading large HOCR result."""
     job_id = "test_large_result"
@@ -225,8 +223,7 @@ async def test_save_and_read_large_result(file_handler):
     assert len(read_content) > 1_000_000
 
 
-@pytest.mark.asyncio
-async def test_file_handler_directory_creation(temp_upload_dir, temp_results_dir, monkeypatch):
+def test_file_handler_directory_creation(temp_upload_dir, temp_results_dir, monkeypatch):
     """Test that FileHandler creates directories if they don't exist."""
     # Use non-existent directories
     new_upload_dir = temp_upload_dir / "new_uploads"
@@ -250,8 +247,7 @@ async def test_file_handler_directory_creation(temp_upload_dir, temp_results_dir
     assert handler.results_dir.is_dir()
 
 
-@pytest.mark.asyncio
-async def test_file_handler_directory_permissions(file_handler):
+def test_file_handler_directory_permissions(file_handler):
     """Test that created directories have secure permissions."""
     # Check upload directory permissions
     upload_mode = os.stat(file_handler.upload_dir).st_mode
@@ -264,7 +260,6 @@ async def test_file_handler_directory_permissions(file_handler):
     assert results_perms == 0o700  # Owner only
 
 
-@pytest.mark.asyncio
 async def test_save_upload_concurrent(file_handler, create_upload_file, sample_jpeg_bytes):
     """Test that concurrent uploads work correctly."""
     import asyncio
@@ -287,7 +282,6 @@ async def test_save_upload_concurrent(file_handler, create_upload_file, sample_j
     assert all(p.exists() for p in paths)
 
 
-@pytest.mark.asyncio
 async def test_delete_temp_file_error_handling(file_handler, temp_upload_dir):
     """Test that delete_temp_file handles errors gracefully."""
     # Create file with restricted parent directory permissions
@@ -308,7 +302,6 @@ async def test_delete_temp_file_error_handling(file_handler, temp_upload_dir):
         os.chmod(restricted_dir, 0o700)
 
 
-@pytest.mark.asyncio
 async def test_save_upload_filename_with_unknown_extension(
     file_handler, create_upload_file, sample_jpeg_bytes
 ):
@@ -3,7 +3,6 @@
 import asyncio
 from unittest.mock import patch
 
-import pytest
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
 
@@ -11,7 +10,6 @@ from src.main import lifespan
 from src.services.ocr.registry_v2 import EngineRegistry
 
 
-@pytest.mark.asyncio
 async def test_lifespan_initializes_engine_registry():
     """Test that lifespan initializes the engine registry."""
     app = FastAPI()
@@ -22,7 +20,6 @@ async def test_lifespan_initializes_engine_registry():
         assert isinstance(app.state.engine_registry, EngineRegistry)
 
 
-@pytest.mark.asyncio
 async def test_lifespan_starts_cleanup_task():
     """Test that lifespan starts the cleanup background task."""
     app = FastAPI()
@@ -37,7 +34,6 @@ async def test_lifespan_starts_cleanup_task():
     assert app.state.cleanup_task.cancelled() or app.state.cleanup_task.done()
 
 
-@pytest.mark.asyncio
 async def test_lifespan_registers_routes_for_all_engines():
     """Test that lifespan registers routes for all discovered engines."""
     app = FastAPI()
@@ -52,7 +48,6 @@ async def test_lifespan_registers_routes_for_all_engines():
         assert len(engine_routes) > 0
 
 
-@pytest.mark.asyncio
 async def test_lifespan_cancels_cleanup_on_shutdown():
     """Test that cleanup task is cancelled on shutdown."""
     app = FastAPI()
@@ -65,7 +60,6 @@ async def test_lifespan_cancels_cleanup_on_shutdown():
     assert cleanup_task.cancelled() or cleanup_task.done()
 
 
-@pytest.mark.asyncio
 async def test_lifespan_logs_startup_completion():
     """Test that lifespan logs successful startup."""
     app = FastAPI()
@@ -75,7 +69,6 @@ async def test_lifespan_logs_startup_completion():
         pass  # Startup successful
 
 
-@pytest.mark.asyncio
 async def test_cleanup_task_runs_periodically():
     """Test that cleanup task would run periodically (short test)."""
     app = FastAPI()
@@ -93,7 +86,6 @@ async def test_cleanup_task_runs_periodically():
         assert not cleanup_task.done()
 
 
-@pytest.mark.asyncio
 async def test_lifespan_handles_missing_engines_gracefully():
     """Test that lifespan continues even if no engines are discovered."""
     app = FastAPI()
@@ -106,7 +98,6 @@ async def test_lifespan_handles_missing_engines_gracefully():
             assert len(app.state.engine_registry.list_engines()) == 0
 
 
-@pytest.mark.asyncio
 async def test_lifespan_creates_routes_for_multiple_engines():
     """Test route creation when multiple engines are available."""
     app = FastAPI()
@@ -127,7 +118,6 @@ async def test_lifespan_creates_routes_for_multiple_engines():
             assert len(info_routes) > 0, f"No info route for {engine_name}"
 
 
-@pytest.mark.asyncio
 async def test_lifespan_cleanup_task_error_handling():
     """Test that cleanup task errors don't crash the application."""
     app = FastAPI()
@@ -141,7 +131,6 @@ async def test_lifespan_cleanup_task_error_handling():
         assert not app.state.cleanup_task.done()
 
 
-@pytest.mark.asyncio
 async def test_lifespan_state_isolation():
     """Test that different app instances have isolated state."""
     app1 = FastAPI()
@@ -152,7 +141,6 @@ async def test_lifespan_state_isolation():
         assert app1.state.engine_registry is not app2.state.engine_registry
 
 
-@pytest.mark.asyncio
 async def test_lifespan_shutdown_waits_for_cleanup():
     """Test that shutdown waits for cleanup task cancellation."""
     app = FastAPI()
@@ -165,7 +153,6 @@ async def test_lifespan_shutdown_waits_for_cleanup():
     assert cleanup_task.cancelled() or cleanup_task.done()
 
 
-@pytest.mark.asyncio
 async def test_lifespan_registry_has_engines():
     """Test that registry discovers engines during startup."""
     app = FastAPI()
@@ -179,7 +166,6 @@ async def test_lifespan_registry_has_engines():
         assert isinstance(engines, list)
 
 
-@pytest.mark.asyncio
 async def test_lifespan_startup_and_shutdown_logging():
     """Test that startup and shutdown are logged."""
     app = FastAPI()
@@ -193,7 +179,6 @@ async def test_lifespan_startup_and_shutdown_logging():
     # Test passes if no exceptions
 
 
-@pytest.mark.asyncio
 async def test_lifespan_routes_include_dependencies():
     """Test that generated routes include proper dependencies."""
     app = FastAPI()
@@ -210,7 +195,6 @@ async def test_lifespan_routes_include_dependencies():
                 assert isinstance(route.dependencies, list)
 
 
-@pytest.mark.asyncio
 async def test_lifespan_metrics_endpoint_mounted():
     """Test that /metrics endpoint is mounted."""
     app = FastAPI()
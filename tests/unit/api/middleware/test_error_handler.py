@@ -2,7 +2,6 @@
 
 from unittest.mock import Mock
 
-import pytest
 from fastapi import FastAPI, HTTPException
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
@@ -28,7 +27,6 @@ def create_mock_request(path: str = "/test") -> Request:
     return request
 
 
-@pytest.mark.asyncio
 async def test_validation_exception_handler_returns_400():
     """Test that validation exception handler returns 400 status code."""
 
@@ -49,7 +47,6 @@ async def test_validation_exception_handler_returns_400():
     assert response.status_code == 400
 
 
-@pytest.mark.asyncio
 async def test_validation_exception_handler_includes_error_details():
     """Test that validation exception handler includes error details."""
 
@@ -78,7 +75,6 @@ async def test_validation_exception_handler_includes_error_details():
     assert len(content["errors"]) > 0
 
 
-@pytest.mark.asyncio
 async def test_validation_exception_handler_includes_error_list():
     """Test that validation errors are included as a list."""
 
@@ -104,7 +100,6 @@ async def test_validation_exception_handler_includes_error_list():
     assert len(content["errors"]) >= 2
 
 
-@pytest.mark.asyncio
 async def test_generic_exception_handler_returns_500():
     """Test that generic exception handler returns 500 status code."""
     exc = Exception("Test error")
@@ -116,7 +111,6 @@ async def test_generic_exception_handler_returns_500():
     assert response.status_code == 500
 
 
-@pytest.mark.asyncio
 async def test_generic_exception_handler_hides_sensitive_info():
     """Test that generic handler hides sensitive error details."""
     exc = Exception("Database connection failed: password=secret123")
@@ -135,7 +129,6 @@ async def test_generic_exception_handler_hides_sensitive_info():
     assert content["detail"] == "Internal server error"
 
 
-@pytest.mark.asyncio
 async def test_generic_exception_handler_includes_error_code():
     """Test that error responses include error code."""
     exc = Exception("Test error")
@@ -167,7 +160,6 @@ def test_add_exception_handlers_registers_handlers():
     assert Exception in app.exception_handlers
 
 
-@pytest.mark.asyncio
 async def test_validation_handler_with_empty_errors():
     """Test validation handler when exc doesn't have errors method."""
     # Create a generic exception that doesn't have errors()
@@ -186,7 +178,6 @@ async def test_validation_handler_with_empty_errors():
     assert content["error_code"] == "validation_error"
 
 
-@pytest.mark.asyncio
 async def test_generic_handler_logs_request_path():
     """Test that generic handler logs the request path."""
     exc = ValueError("Test error")
@@ -198,7 +189,6 @@ async def test_generic_handler_logs_request_path():
     assert response.status_code == 500
 
 
-@pytest.mark.asyncio
 async def test_validation_handler_response_structure():
     """Test validation handler returns correct JSON structure."""
 
@@ -225,7 +215,6 @@ async def test_validation_handler_response_structure():
     assert isinstance(content["errors"], list)
 
 
-@pytest.mark.asyncio
 async def test_http_exception_handler():
     """Test that http exception handler returns correct status and content."""
     exc = HTTPException(status_code=418, detail="I'm a teapot")
@@ -33,7 +33,6 @@ def create_mock_request(
     return request
 
 
-@pytest.mark.asyncio
 async def test_logging_middleware_generates_request_id():
     """Test that middleware generates a unique request ID."""
     middleware = LoggingMiddleware(app=MagicMock())
@@ -54,7 +53,6 @@ async def test_logging_middleware_generates_request_id():
     uuid.UUID(request_id)  # Raises ValueError if invalid
 
 
-@pytest.mark.asyncio
 async def test_logging_middleware_adds_request_id_to_headers():
     """Test that middleware adds X-Request-ID header to response."""
     middleware = LoggingMiddleware(app=MagicMock())
@@ -70,7 +68,6 @@ async def test_logging_middleware_adds_request_id_to_headers():
     assert len(response.headers["X-Request-ID"]) == 36  # UUID length
 
 
-@pytest.mark.asyncio
 async def test_logging_middleware_logs_request_details():
     """Test that middleware logs request method, path, and client IP."""
     middleware = LoggingMiddleware(app=MagicMock())
@@ -89,7 +86,6 @@ async def test_logging_middleware_logs_request_details():
     assert response.status_code == 200
 
 
-@pytest.mark.asyncio
 async def test_logging_middleware_measures_latency():
     """Test that middleware measures and logs request latency."""
     middleware = LoggingMiddleware(app=MagicMock())
@@ -111,7 +107,6 @@ async def test_logging_middleware_measures_latency():
     assert response.status_code == 200
 
 
-@pytest.mark.asyncio
 async def test_logging_middleware_logs_status_code():
     """Test that middleware logs response status code."""
     middleware = LoggingMiddleware(app=MagicMock())
@@ -126,7 +121,6 @@ async def test_logging_middleware_logs_status_code():
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_logging_middleware_clears_context_vars():
     """Test that middleware clears context vars before each request."""
     middleware = LoggingMiddleware(app=MagicMock())
@@ -145,7 +139,6 @@ async def test_logging_middleware_clears_context_vars():
     # This is tested implicitly by the middleware not crashing
 
 
-@pytest.mark.asyncio
 async def test_logging_middleware_handles_exceptions():
     """Test that middleware logs exceptions and re-raises them."""
     middleware = LoggingMiddleware(app=MagicMock())
@@ -163,7 +156,6 @@ async def test_logging_middleware_handles_exceptions():
         await middleware.dispatch(request, call_next)
 
 
-@pytest.mark.asyncio
 async def test_logging_middleware_logs_error_details():
     """Test that middleware logs error type and message."""
     middleware = LoggingMiddleware(app=MagicMock())
@@ -180,7 +172,6 @@ async def test_logging_middleware_logs_error_details():
         await middleware.dispatch(request, call_next)
 
 
-@pytest.mark.asyncio
 async def test_logging_middleware_handles_missing_client():
     """Test that middleware handles requests without client info."""
     middleware = LoggingMiddleware(app=MagicMock())
@@ -196,7 +187,6 @@ async def test_logging_middleware_handles_missing_client():
     assert response.status_code == 200
 
 
-@pytest.mark.asyncio
 async def test_logging_middleware_unique_request_ids():
     """Test that each request gets a unique request ID."""
     middleware = LoggingMiddleware(app=MagicMock())
@@ -221,7 +211,6 @@ async def test_logging_middleware_unique_request_ids():
     assert id1 != id2
 
 
-@pytest.mark.asyncio
 async def test_logging_middleware_binds_context_vars():
     """Test that middleware binds all required context vars."""
     middleware = LoggingMiddleware(app=MagicMock())
@@ -251,7 +240,6 @@ async def test_logging_middleware_binds_context_vars():
     assert True  # If we got here, context binding worked
 
 
-@pytest.mark.asyncio
 async def test_logging_middleware_latency_calculation():
     """Test that latency is calculated correctly."""
     middleware = LoggingMiddleware(app=MagicMock())
@@ -273,7 +261,6 @@ async def test_logging_middleware_latency_calculation():
     assert response.status_code == 200
 
 
-@pytest.mark.asyncio
 async def test_logging_middleware_different_methods():
     """Test middleware with different HTTP methods."""
     middleware = LoggingMiddleware(app=MagicMock())
@@ -287,7 +274,6 @@ async def test_logging_middleware_different_methods():
         assert response.status_code == 200
 
 
-@pytest.mark.asyncio
 async def test_logging_middleware_different_paths():
     """Test middleware with different request paths."""
     middleware = LoggingMiddleware(app=MagicMock())
@@ -6,14 +6,12 @@ from fastapi import HTTPException
 from src.api.dependencies import get_settings, verify_api_key
 
 
-@pytest.mark.asyncio
 async def test_get_settings():
     """Test get_settings dependency returns the settings object."""
     settings = await get_settings()
     assert settings is not None
 
 
-@pytest.mark.asyncio
 async def test_verify_api_key_auth_disabled():
     """Test that verification is skipped when auth is disabled."""
     with patch("src.api.dependencies.settings") as mock_settings:
@@ -23,7 +21,6 @@ async def test_verify_api_key_auth_disabled():
         assert result == "auth_disabled"
 
 
-@pytest.mark.asyncio
 async def test_verify_api_key_missing_header():
     """Test that 401 is raised when auth is enabled but header is missing."""
     with patch("src.api.dependencies.settings") as mock_settings:
@@ -37,7 +34,6 @@ async def test_verify_api_key_missing_header():
         assert "API key required" in exc_info.value.detail
 
 
-@pytest.mark.asyncio
 async def test_verify_api_key_no_keys_configured():
     """Test that 500 is raised when auth is enabled but no keys are configured."""
     with patch("src.api.dependencies.settings") as mock_settings:
@@ -51,7 +47,6 @@ async def test_verify_api_key_no_keys_configured():
         assert "no API keys are configured" in exc_info.value.detail
 
 
-@pytest.mark.asyncio
 async def test_verify_api_key_invalid_key():
     """Test that 401 is raised when the provided key is invalid."""
     with patch("src.api.dependencies.settings") as mock_settings:
@@ -65,7 +60,6 @@ async def test_verify_api_key_invalid_key():
         assert "Invalid API key" in exc_info.value.detail
 
 
-@pytest.mark.asyncio
 async def test_verify_api_key_valid_key():
     """Test that the key is returned when it is valid."""
     with patch("src.api.dependencies.settings") as mock_settings:
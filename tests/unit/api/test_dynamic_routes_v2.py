@@ -5,7 +5,10 @@ from typing import Annotated, get_args, get_origin
 from fastapi import Form
 from pydantic import BaseModel, Field
 
-from src.api.routes.v2.dynamic_routes import create_form_params_from_model
+from src.api.routes.v2.dynamic_routes import (
+    build_tesseract_config,
+    create_form_params_from_model,
+)
 
 
 class ComplexModel(BaseModel):
@@ -48,3 +51,14 @@ def test_create_form_params_defaults():
     # The default value is set directly on the Parameter object
     assert params["options"].default == [1, 2]
     assert params["gpu"].default is True
+
+
+def test_build_tesseract_config_all_params():
+    """Test that all set parameters are rendered as Tesseract flags."""
+    assert build_tesseract_config(6, 1, 300) == "--psm 6 --oem 1 --dpi 300"
+
+
+def test_build_tesseract_config_skips_unset_params():
+    """Test that None parameters are omitted from the config string."""
+    assert build_tesseract_config(None, 3, None) == "--oem 3"
+    assert build_tesseract_config(None, None, None) == ""
@@ -12,8 +12,7 @@ from src.services.ocr.registry_v2 import EngineRegistry
 # ==============================================================================
 
 
-@pytest.mark.asyncio
-async def test_process_timeout_returns_504(app):
+def test_process_timeout_returns_504(app):
     """Test that OCR processing timeout returns 504 Gateway Timeout."""
 
     # Create a mock engine that simulates a timeout
@@ -57,8 +56,7 @@ async def test_process_timeout_returns_504(app):
         assert "timeout" in response.json()["detail"].lower()
 
 
-@pytest.mark.asyncio
-async def test_circuit_breaker_open_returns_503(app):
+def test_circuit_breaker_open_returns_503(app):
     """Test that open circuit breaker returns 503 Service Unavailable."""
 
     mock_engine = MagicMock()
@@ -87,8 +85,7 @@ async def test_circuit_breaker_open_returns_503(app):
         assert "temporarily unavailable" in response.json()["detail"].lower()
 
 
-@pytest.mark.asyncio
-async def test_generic_exception_returns_500(app):
+def test_generic_exception_returns_500(app):
     """Test that unexpected errors return 500 Internal Server Error."""
 
     mock_engine = MagicMock()
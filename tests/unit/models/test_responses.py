@@ -0,0 +1,48 @@
+"""Unit tests for API response models.
+
+Tests for hOCR well-formedness validation on SyncOCRResponse.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from src.models.responses import SyncOCRResponse
+
+VALID_HOCR = """<?xml version="1.0" encoding="UTF-8"?>
+<html xmlns="http://www.w3.org/1999/xhtml">
+<body>
+  <div class="ocr_page" id="page_1" title="bbox 0 0 100 100">
+    <span class="ocrx_word" id="word_1_1" title="bbox 10 10 50 50; x_wconf 95">Test</span>
+  </div>
+</body>
+</html>"""
+
+
+def _build_response(hocr: str) -> SyncOCRResponse:
+    return SyncOCRResponse(
+        hocr=hocr,
+        processing_duration_seconds=1.0,
+        engine="tesseract",
+        pages=1,
+    )
+
+
+def test_sync_ocr_response_accepts_well_formed_hocr():
+    """Test that well-formed hOCR passes validation unchanged."""
+    response = _build_response(VALID_HOCR)
+
+    assert response.hocr == VALID_HOCR
+
+
+@pytest.mark.parametrize(
+    "hocr",
+    [
+        '<html><body><div class="ocr_page"></body></html>',  # Unclosed <div>
+        "<html><body>",  # Truncated document
+        "not xml at all",
+    ],
+)
+def test_sync_ocr_response_rejects_malformed_hocr(hocr):
+    """Test that malformed hOCR raises ValidationError."""
+    with pytest.raises(ValidationError, match="HOCR content is not valid XML"):
+        _build_response(hocr)
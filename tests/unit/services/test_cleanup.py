@@ -36,15 +36,13 @@ def cleanup_service(temp_upload_dir, temp_results_dir, monkeypatch):
     return service
 
 
-@pytest.mark.asyncio
-async def test_cleanup_service_initialization(cleanup_service, temp_upload_dir, temp_results_dir):
+def test_cleanup_service_initialization(cleanup_service, temp_upload_dir, temp_results_dir):
     """Test that cleanup service initializes with correct directories."""
     assert cleanup_service.upload_dir == temp_upload_dir
     assert cleanup_service.results_dir == temp_results_dir
     assert cleanup_service.expiration_seconds == 3600  # 1 hour in seconds
 
 
-@pytest.mark.asyncio
 async def test_cleanup_expired_files_removes_old_files(cleanup_service, temp_upload_dir):
     """Test that expired files are deleted."""
     # Create old file (modify timestamp to 2 hours ago)
@@ -64,7 +62,6 @@ async def test_cleanup_expired_files_removes_old_files(cleanup_service, temp_upl
     assert not old_file.exists()
 
 
-@pytest.mark.asyncio
 async def test_cleanup_keeps_recent_files(cleanup_service, temp_upload_dir):
     """Test that recent files are not deleted."""
     # Create recent file
@@ -78,7 +75,6 @@ async def test_cleanup_keeps_recent_files(cleanup_service, temp_upload_dir):
     assert recent_file.exists()
 
 
-@pytest.mark.asyncio
 async def test_cleanup_both_directories(cleanup_service, temp_upload_dir, temp_results_dir):
     """Test that cleanup processes both upload and results directories."""
     # Create old files in both directories
@@ -103,7 +99,6 @@ async def test_cleanup_both_directories(cleanup_service, temp_upload_dir, temp_r
     assert not old_result.exists()
 
 
-@pytest.mark.asyncio
 async def test_cleanup_handles_file_deletion_errors(cleanup_service, temp_upload_dir):
     """Test graceful error handling when file deletion fails."""
     # Create file
@@ -132,7 +127,6 @@ async def test_cleanup_handles_file_deletion_errors(cleanup_service, temp_upload
     assert problem_file.exists()
 
 
-@pytest.mark.asyncio
 async def test_cleanup_only_deletes_files_not_directories(cleanup_service, temp_upload_dir):
     """Test that cleanup only deletes files, not subdirectories."""
     # Create old subdirectory
@@ -153,7 +147,6 @@ async def test_cleanup_only_deletes_files_not_directories(cleanup_service, temp_
     assert old_subdir.is_dir()
 
 
-@pytest.mark.asyncio
 async def test_cleanup_results_only_hocr_files(cleanup_service, temp_results_dir):
     """Test that results cleanup only deletes .hocr files."""
     # Create old .hocr file
@@ -180,7 +173,6 @@ async def test_cleanup_results_only_hocr_files(cleanup_service, temp_results_dir
     assert old_other.exists()
 
 
-@pytest.mark.asyncio
 async def test_cleanup_with_no_files(cleanup_service):
     """Test cleanup with empty directories."""
     # Run cleanup on empty directories
@@ -188,7 +180,6 @@ async def test_cleanup_with_no_files(cleanup_service):
     # Should complete without errors
 
 
-@pytest.mark.asyncio
 async def test_cleanup_mixed_old_and_recent_files(cleanup_service, temp_upload_dir):
     """Test cleanup with mix of old and recent files."""
     # Create old file
@@ -213,7 +204,6 @@ async def test_cleanup_mixed_old_and_recent_files(cleanup_service, temp_upload_d
     assert recent_file.exists()
 
 
-@pytest.mark.asyncio
 async def test_cleanup_expiration_threshold(cleanup_service, temp_upload_dir):
     """Test that cleanup respects expiration threshold exactly."""
     # Create file at exactly expiration time (1 hour + 1 second ago)
@@ -241,8 +231,7 @@ async def test_cleanup_expiration_threshold(cleanup_service, temp_upload_dir):
     assert not_expired_file.exists()
 
 
-@pytest.mark.asyncio
-async def test_cleanup_service_custom_expiration():
+def test_cleanup_service_custom_expiration():
     """Test cleanup service with custom expiration time."""
     from src.config import Settings
 
@@ -256,7 +245,6 @@ async def test_cleanup_service_custom_expiration():
         assert service.expiration_seconds == 24 * 3600
 
 
-@pytest.mark.asyncio
 async def test_cleanup_logs_deleted_count(cleanup_service, temp_upload_dir):
     """Test that cleanup logs the number of deleted files."""
     # Create multiple old files
@@ -280,7 +268,6 @@ async def test_cleanup_logs_deleted_count(cleanup_service, temp_upload_dir):
         assert call_args[1]["deleted_files"] == 3
 
 
-@pytest.mark.asyncio
 async def test_cleanup_no_log_when_nothing_deleted(cleanup_service, temp_upload_dir):
     """Test that cleanup doesn't log when no files are deleted."""
     # Create recent file
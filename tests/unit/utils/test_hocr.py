@@ -21,14 +21,12 @@ from ocrbridge.core.utils.hocr import (
 # ==============================================================================
 
 
-def test_parse_hocr_valid(sample_hocr):
+def test_parse_hocr_valid(parsed_sample_hocr):
     """Test parsing valid HOCR XML."""
-    info = parse_hocr(sample_hocr)
-
-    assert isinstance(info, HOCRInfo)
-    assert info.page_count >= 1
-    assert info.word_count >= 1
-    assert info.has_bounding_boxes is True
+    assert isinstance(parsed_sample_hocr, HOCRInfo)
+    assert parsed_sample_hocr.page_count >= 1
+    assert parsed_sample_hocr.word_count >= 1
+    assert parsed_sample_hocr.has_bounding_boxes is True
 
 
 def test_parse_hocr_multi_page(sample_hocr_multi_page):
@@ -39,27 +37,21 @@ def test_parse_hocr_multi_page(sample_hocr_multi_page):
     assert info.word_count == 4  # 2 words per page
 
 
-def test_parse_hocr_counts_pages(sample_hocr):
+def test_parse_hocr_counts_pages(parsed_sample_hocr):
     """Test that parse_hocr correctly counts ocr_page elements."""
-    info = parse_hocr(sample_hocr)
-
     # sample_hocr has 1 page
-    assert info.page_count == 1
+    assert parsed_sample_hocr.page_count == 1
 
 
-def test_parse_hocr_counts_words(sample_hocr):
+def test_parse_hocr_counts_words(parsed_sample_hocr):
     """Test that parse_hocr correctly counts ocrx_word elements."""
-    info = parse_hocr(sample_hocr)
-
     # sample_hocr has 2 words: "Hello" and "World"
-    assert info.word_count == 2
+    assert parsed_sample_hocr.word_count == 2
 
 
-def test_parse_hocr_detects_bboxes(sample_hocr):
+def test_parse_hocr_detects_bboxes(parsed_sample_hocr):
     """Test that parse_hocr detects presence of bounding boxes."""
-    info = parse_hocr(sample_hocr)
-
-    assert info.has_bounding_boxes is True
+    assert parsed_sample_hocr.has_bounding_boxes is True
 
 
 def test_parse_hocr_no_bbox(invalid_hocr_no_bbox):
@@ -73,11 +65,9 @@ def test_parse_hocr_invalid_xml():
     """Test that invalid XML raises HOCRParseError."""
     invalid_xml = "<html><unclosed>"
 
-    with pytest.raises(HOCRParseError) as exc_info:
+    with pytest.raises(HOCRParseError, match="Failed to parse"):
         parse_hocr(invalid_xml)
 
-    assert "Failed to parse" in str(exc_info.value)
-
 
 def test_parse_hocr_empty_string():
     """Test parsing empty string raises HOCRParseError."""
@@ -111,29 +101,21 @@ def test_validate_hocr_valid(sample_hocr):
 
 def test_validate_hocr_no_pages(invalid_hocr_no_pages):
     """Test that HOCR without pages raises HOCRValidationError."""
-    with pytest.raises(HOCRValidationError) as exc_info:
+    with pytest.raises(HOCRValidationError, match="(?i)page"):
         validate_hocr(invalid_hocr_no_pages)
 
-    error_message = str(exc_info.value)
-    assert "page" in error_message.lower()
-
 
 def test_validate_hocr_no_bboxes(invalid_hocr_no_bbox):
     """Test that HOCR without bounding boxes raises HOCRValidationError."""
-    with pytest.raises(HOCRValidationError) as exc_info:
+    with pytest.raises(HOCRValidationError, match="(?i)bounding box"):
         validate_hocr(invalid_hocr_no_bbox)
 
-    error_message = str(exc_info.value)
-    assert "bounding box" in error_message.lower()
-
 
 def test_validate_hocr_invalid_xml():
     """Test that invalid XML is caught during validation."""
-    with pytest.raises(HOCRValidationError) as exc_info:
+    with pytest.raises(HOCRValidationError, match="(?i)parsing failed"):
         validate_hocr("<invalid>xml")
 
-    assert "parsing failed" in str(exc_info.value).lower()
-
 
 # ==============================================================================
 # Bounding Box Extraction Tests
@@ -199,11 +181,10 @@ def test_extract_bbox_returns_tuple():
 # ==============================================================================
 
 
-def test_parse_and_validate_workflow(sample_hocr):
+def test_parse_and_validate_workflow(sample_hocr, parsed_sample_hocr):
     """Test complete workflow of parsing and validating HOCR."""
     # Parse
-    info = parse_hocr(sample_hocr)
-    assert info.page_count >= 1
+    assert parsed_sample_hocr.page_count >= 1
 
     # Validate
     validate_hocr(sample_hocr)  # Should not raise
@@ -3,118 +3,45 @@
 Tests for metric definitions, types, and basic functionality.
 """
 
-from prometheus_client import Counter, Gauge, Histogram
+import pytest
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram
 
 from src.utils import metrics
 
-
-def test_jobs_created_total_metric():
-    """Test that jobs_created_total counter is defined."""
-    assert hasattr(metrics, "jobs_created_total")
-    assert isinstance(metrics.jobs_created_total, Counter)
-    # Prometheus automatically appends _total to counter names
-    assert metrics.metric_name(metrics.jobs_created_total) == "ocr_jobs_created"
-
-
-def test_jobs_completed_total_metric():
-    """Test that jobs_completed_total counter is defined with engine label."""
-    assert hasattr(metrics, "jobs_completed_total")
-    assert isinstance(metrics.jobs_completed_total, Counter)
-    # Prometheus automatically appends _total to counter names, so _name doesn't include it
-    assert metrics.metric_name(metrics.jobs_completed_total) == "ocr_jobs_completed"
-    # Should have 'engine' label
-    assert "engine" in metrics.metric_labels(metrics.jobs_completed_total)
-
-
-def test_jobs_failed_total_metric():
-    """Test that jobs_failed_total counter is defined with labels."""
-    assert hasattr(metrics, "jobs_failed_total")
-    assert isinstance(metrics.jobs_failed_total, Counter)
-    # Prometheus automatically appends _total to counter names, so _name doesn't include it
-    assert metrics.metric_name(metrics.jobs_failed_total) == "ocr_jobs_failed"
-    # Should have 'error_code' and 'engine' labels
-    labels = metrics.metric_labels(metrics.jobs_failed_total)
-    assert "error_code" in labels
-    assert "engine" in labels
-
-
-def test_job_processing_duration_seconds_metric():
-    """Test that processing duration histogram is defined."""
-    assert hasattr(metrics, "job_processing_duration_seconds")
-    assert isinstance(metrics.job_processing_duration_seconds, Histogram)
-    assert (
-        metrics.metric_name(metrics.job_processing_duration_seconds)
-        == "ocr_job_processing_duration_seconds"
-    )
-
-
-def test_job_total_duration_seconds_metric():
-    """Test that total duration histogram is defined."""
-    assert hasattr(metrics, "job_total_duration_seconds")
-    assert isinstance(metrics.job_total_duration_seconds, Histogram)
-    assert (
-        metrics.metric_name(metrics.job_total_duration_seconds) == "ocr_job_total_duration_seconds"
-    )
-
-
-def test_job_queue_duration_seconds_metric():
-    """Test that queue duration histogram is defined."""
-    assert hasattr(metrics, "job_queue_duration_seconds")
-    assert isinstance(metrics.job_queue_duration_seconds, Histogram)
-    assert (
-        metrics.metric_name(metrics.job_queue_duration_seconds) == "ocr_job_queue_duration_seconds"
-    )
-
-
-def test_active_jobs_metric():
-    """Test that active jobs gauge is defined."""
-    assert hasattr(metrics, "active_jobs")
-    assert isinstance(metrics.active_jobs, Gauge)
-    assert metrics.metric_name(metrics.active_jobs) == "ocr_active_jobs"
-
-
-def test_document_size_bytes_metric():
-    """Test that document size histogram is defined."""
-    assert hasattr(metrics, "document_size_bytes")
-    assert isinstance(metrics.document_size_bytes, Histogram)
-    assert metrics.metric_name(metrics.document_size_bytes) == "ocr_document_size_bytes"
-
-
-def test_document_pages_metric():
-    """Test that document pages histogram is defined."""
-    assert hasattr(metrics, "document_pages")
-    assert isinstance(metrics.document_pages, Histogram)
-    assert metrics.metric_name(metrics.document_pages) == "ocr_document_pages"
-
-
-def test_sync_ocr_requests_total_metric():
-    """Test that sync requests counter is defined with labels."""
-    assert hasattr(metrics, "sync_ocr_requests_total")
-    assert isinstance(metrics.sync_ocr_requests_total, Counter)
-    labels = metrics.metric_labels(metrics.sync_ocr_requests_total)
-    assert "engine" in labels
-    assert "status" in labels
-
-
-def test_sync_ocr_duration_seconds_metric():
-    """Test that sync duration histogram is defined with engine label."""
-    assert hasattr(metrics, "sync_ocr_duration_seconds")
-    assert isinstance(metrics.sync_ocr_duration_seconds, Histogram)
-    assert "engine" in metrics.metric_labels(metrics.sync_ocr_duration_seconds)
-
-
-def test_sync_ocr_timeouts_total_metric():
-    """Test that sync timeouts counter is defined."""
-    assert hasattr(metrics, "sync_ocr_timeouts_total")
-    assert isinstance(metrics.sync_ocr_timeouts_total, Counter)
-    assert "engine" in metrics.metric_labels(metrics.sync_ocr_timeouts_total)
-
-
-def test_sync_ocr_file_size_bytes_metric():
-    """Test that sync file size histogram is defined."""
-    assert hasattr(metrics, "sync_ocr_file_size_bytes")
-    assert isinstance(metrics.sync_ocr_file_size_bytes, Histogram)
-    assert "engine" in metrics.metric_labels(metrics.sync_ocr_file_size_bytes)
+# (module attribute, metric type, registered name, required labels).
+# Prometheus strips the _total suffix from counter names, so _name omits it.
+METRIC_SPECS = [
+    ("jobs_created_total", Counter, "ocr_jobs_created", []),
+    ("jobs_completed_total", Counter, "ocr_jobs_completed", ["engine"]),
+    ("jobs_failed_total", Counter, "ocr_jobs_failed", ["error_code", "engine"]),
+    (
+        "job_processing_duration_seconds",
+        Histogram,
+        "ocr_job_processing_duration_seconds",
+        [],
+    ),
+    ("job_total_duration_seconds", Histogram, "ocr_job_total_duration_seconds", []),
+    ("job_queue_duration_seconds", Histogram, "ocr_job_queue_duration_seconds", []),
+    ("active_jobs", Gauge, "ocr_active_jobs", []),
+    ("document_size_bytes", Histogram, "ocr_document_size_bytes", []),
+    ("document_pages", Histogram, "ocr_document_pages", []),
+    ("sync_ocr_requests_total", Counter, "sync_ocr_requests", ["engine", "status"]),
+    ("sync_ocr_duration_seconds", Histogram, "sync_ocr_duration_seconds", ["engine"]),
+    ("sync_ocr_timeouts_total", Counter, "sync_ocr_timeouts", ["engine"]),
+    ("sync_ocr_file_size_bytes", Histogram, "sync_ocr_file_size_bytes", ["engine"]),
+]
+
+
+@pytest.mark.parametrize(
+    "attr,metric_type,name,labels", METRIC_SPECS, ids=[spec[0] for spec in METRIC_SPECS]
+)
+def test_metric_defined(attr, metric_type, name, labels):
+    """Test that each metric is defined with the expected type, name, and labels."""
+    assert hasattr(metrics, attr)
+    metric = getattr(metrics, attr)
+    assert isinstance(metric, metric_type)
+    assert metrics.metric_name(metric) == name
+    assert set(labels) <= set(metrics.metric_labels(metric))
 
 
 def test_histogram_buckets_processing_duration():
@@ -204,23 +131,7 @@ def test_histogram_with_labels_observe():
 
 def test_all_metrics_exported():
     """Test that all expected metrics are exported from module."""
-    expected_metrics = [
-        "jobs_created_total",
-        "jobs_completed_total",
-        "jobs_failed_total",
-        "job_processing_duration_seconds",
-        "job_total_duration_seconds",
-        "job_queue_duration_seconds",
-        "active_jobs",
-        "document_size_bytes",
-        "document_pages",
-        "sync_ocr_requests_total",
-        "sync_ocr_duration_seconds",
-        "sync_ocr_timeouts_total",
-        "sync_ocr_file_size_bytes",
-    ]
-
-    for metric_name in expected_metrics:
+    for metric_name, *_ in METRIC_SPECS:
         assert hasattr(metrics, metric_name), f"Missing metric: {metric_name}"
 
 
@@ -247,3 +158,38 @@ def test_metrics_have_help_text():
     assert metrics.metric_help(metrics.jobs_completed_total)
     assert metrics.metric_help(metrics.active_jobs)
     assert len(metrics.metric_help(metrics.jobs_created_total)) > 0
+
+
+@pytest.fixture
+def unregistered_metrics():
+    """Unregister the metrics module's collectors so it can be re-executed.
+
+    The original collectors are registered and bound to the module again
+    afterwards, since other modules hold references to them.
+    """
+    originals = {
+        name: value
+        for name, value in vars(metrics).items()
+        if isinstance(value, (Counter, Gauge, Histogram))
+    }
+    for collector in originals.values():
+        REGISTRY.unregister(collector)
+
+    yield
+
+    for name, collector in originals.items():
+        REGISTRY.unregister(getattr(metrics, name))
+        REGISTRY.register(collector)
+        setattr(metrics, name, collector)
+
+
+def test_metrics_module_reload_after_unregister(unregistered_metrics):
+    """Test that the metrics module re-executes once its collectors are unregistered."""
+    import importlib
+
+    counter = metrics.jobs_created_total
+
+    importlib.reload(metrics)
+
+    assert metrics.jobs_created_total is not counter
+    assert metrics.metric_name(metrics.jobs_created_total) == "ocr_jobs_created"
@@ -5,6 +5,9 @@ Tests for cryptographically secure job ID generation.
 
 from src.utils.security import generate_job_id
 
+# URL-safe base64 alphabet (alphanumeric, hyphen, underscore)
+URL_SAFE_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
+
 
 def test_generate_job_id_format():
     """Test that generated job ID is URL-safe base64 string."""
@@ -14,9 +17,7 @@ def test_generate_job_id_format():
     assert isinstance(job_id, str)
 
     # Should only contain URL-safe base64 characters
-    # (alphanumeric, hyphen, underscore)
-    valid_chars = set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
-    assert all(c in valid_chars for c in job_id)
+    assert set(job_id) <= URL_SAFE_CHARS
 
 
 def test_generate_job_id_length():
@@ -84,6 +85,5 @@ def test_generate_job_id_consistency():
     assert lengths[0] == 43
 
     # All should match valid character set
-    valid_chars = set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
     for job_id in job_ids:
-        assert all(c in valid_chars for c in job_id)
+        assert set(job_id) <= URL_SAFE_CHARS